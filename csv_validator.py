@@ -1,10 +1,223 @@
 import csv
-from typing import List, Dict, Tuple, Optional
+import io
+import itertools
+import mmap
+import os
+import re
+from collections import deque
+from operator import itemgetter
+from typing import Iterator, List, Dict, Tuple, Optional
+
+# A batch is the field count of every row in it, plus the values of each typed
+# column (keyed by column index) for the rows that have the expected field count.
+Batch = Tuple[List[int], Dict[int, list]]
+
+# Number of data rows validated together when reading through the csv module.
+# Bounds memory on large files while still letting each typed column be cast in
+# a single pass.
+_BATCH_SIZE = 8192
+
+# Number of bytes scanned per batch when reading an unquoted file through mmap.
+_BLOCK_SIZE = 8 << 20
+
+# A '\r' that is not part of a '\r\n'. csv.reader ends a row there, the mmap scan
+# does not, so files containing one are read through the csv module.
+_BARE_CR_RE = re.compile(rb'\r(?!\n)')
+
+# Each pattern matches the lines of a newline-joined bytes column that are not a
+# plain int / float. Lines it skips always cast cleanly, so only the matches are
+# checked individually; those (e.g. ' 5', '.5', 'inf') are still decided by the
+# cast itself.
+_INT_RE = re.compile(rb'^(?!-?\d+$).*$', re.MULTILINE)
+_FLOAT_RE = re.compile(rb'^(?!-?\d+(?:\.\d+)?(?:[eE]-?\d+)?$).*$', re.MULTILINE)
+_VALIDATORS = {
+    int: _INT_RE,
+    float: _FLOAT_RE,
+}
+
+
+def _casts_cleanly(values: list, expected_type: type) -> bool:
+    """
+    Returns True if every value casts to expected_type, casting the column in one pass.
+    """
+    try:
+        deque(map(expected_type, values), maxlen=0)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _suspect_indices(values: List[bytes], pattern: re.Pattern) -> Iterator[int]:
+    """
+    Yields the positions of values matched by one of the _VALIDATORS patterns.
+
+    The column is joined on b'\n' and scanned with a single finditer, so values the
+    pattern skips are never touched from Python.
+    """
+    column = b'\n'.join(values)
+    index = 0
+    last_start = 0
+    for match in pattern.finditer(column):
+        start = match.start()
+        index += column.count(b'\n', last_start, start)
+        last_start = start
+        yield index
+
+
+def _invalid_indices(values: list, expected_type: type) -> List[int]:
+    """
+    Returns the positions in a column of values that cannot be cast to expected_type.
+
+    The whole column is first cast in one pass; the per-cell scan only runs when
+    that pass fails, so clean columns never pay for the Python-level loop. For bytes
+    columns with a pattern in _VALIDATORS, that scan only visits the values the
+    pattern flags.
+    """
+    if _casts_cleanly(values, expected_type):
+        return []
+
+    pattern = _VALIDATORS.get(expected_type) if values and isinstance(values[0], bytes) else None
+    if pattern is not None:
+        candidates = _suspect_indices(values, pattern)
+    else:
+        candidates = range(len(values))
+
+    invalid = []
+    for i in candidates:
+        value = values[i]
+        if isinstance(value, bytes) and not value.isascii():
+            # int() and float() only accept non-ASCII digits and whitespace as str.
+            value = value.decode('utf-8')
+
+        if not value.strip() and expected_type is not str:
+            # Allow empty values for non-string types, assuming they represent NULL.
+            # Add specific logic here if empty strings should be an error.
+            continue
+
+        try:
+            # Perform type casting to validate
+            expected_type(value)
+        except (ValueError, TypeError):
+            invalid.append(i)
+    return invalid
+
+
+def _iter_reader_batches(reader: Iterator[List[str]], num_columns: int, col_indices: List[int]) -> Iterator[Batch]:
+    """
+    Yields batches of up to _BATCH_SIZE rows from a csv reader.
+    """
+    while True:
+        rows = list(itertools.islice(reader, _BATCH_SIZE))
+        if not rows:
+            return
+
+        counts = list(map(len, rows))
+        if set(counts) != {num_columns}:
+            rows = [row for row in rows if len(row) == num_columns]
+        yield counts, {i: list(map(itemgetter(i), rows)) for i in col_indices}
+
+
+def _iter_mmap_batches(mm: mmap.mmap, pos: int, num_columns: int, col_indices: List[int]) -> Iterator[Batch]:
+    """
+    Yields batches from the unquoted CSV body mapped in mm, starting at pos.
+
+    The mapping is consumed in blocks of whole lines, and lines and fields are found
+    with bytes methods, which scan with memchr. When every line of a block has the
+    expected field count, the block is split once into a flat list of fields and each
+    typed column is sliced out of it, so no per-row lists are built. Values are left
+    as bytes.
+    """
+    size = len(mm)
+    max_split = max(col_indices, default=-1) + 1
+
+    while pos < size:
+        if pos + _BLOCK_SIZE >= size:
+            end = size - 1 if mm[size - 1:size] == b'\n' else size
+        else:
+            end = mm.rfind(b'\n', pos, pos + _BLOCK_SIZE)
+            if end == -1:
+                # A single line longer than the block size.
+                end = mm.find(b'\n', pos + _BLOCK_SIZE)
+                if end == -1:
+                    end = size
+
+        block = mm[pos:end]
+        pos = end + 1
+        if b'\r' in block:
+            block = block.replace(b'\r\n', b'\n')
+            if block.endswith(b'\r'):
+                block = block[:-1]
+
+        lines = block.split(b'\n')
+        separators = list(map(bytes.count, lines, itertools.repeat(b',')))
+
+        if set(separators) == {num_columns - 1} and b'' not in lines:
+            fields = block.replace(b'\n', b',').split(b',')
+            yield [num_columns] * len(lines), {i: fields[i::num_columns] for i in col_indices}
+        else:
+            # Blank lines are empty rows, as they are for csv.reader.
+            counts = [count + 1 if line else 0 for count, line in zip(separators, lines)]
+            rows = [
+                line.split(b',', max_split)
+                for line, count in zip(lines, counts)
+                if count == num_columns
+            ]
+            yield counts, {i: list(map(itemgetter(i), rows)) for i in col_indices}
+
+
+def _validate_batch(
+    counts: List[int],
+    columns: Dict[int, list],
+    first_row_num: int,
+    num_columns: int,
+    typed_columns: List[Tuple[str, int, type]]
+) -> List[str]:
+    """
+    Validates a batch of consecutive rows column by column.
+
+    Column values may be str (csv module) or bytes (mmap scan); bytes are only
+    decoded for types without a pattern in _VALIDATORS. Errors are returned
+    in the same order a row-by-row scan would produce them.
+    """
+    batch_errors: List[Tuple[int, int, str]] = []
+    row_nums = range(first_row_num, first_row_num + len(counts))
+
+    if set(counts) != {num_columns}:
+        complete_row_nums = []
+        for row_num, count in zip(row_nums, counts):
+            if count != num_columns:
+                batch_errors.append(
+                    (row_num, -1, f"Row {row_num}: Mismatched number of columns. Expected {num_columns}, found {count}.")
+                )
+            else:
+                complete_row_nums.append(row_num)
+        row_nums = complete_row_nums
+
+    for position, (col_name, col_index, expected_type) in enumerate(typed_columns):
+        values = columns[col_index]
+        if values and isinstance(values[0], bytes) and expected_type not in _VALIDATORS:
+            # Lines never contain b'\n', so the whole column can be decoded in one call.
+            values = b'\n'.join(values).decode('utf-8').split('\n')
+
+        for i in _invalid_indices(values, expected_type):
+            value = values[i]
+            if isinstance(value, bytes):
+                value = value.decode('utf-8')
+            batch_errors.append((
+                row_nums[i],
+                position,
+                f"Row {row_nums[i]}, Column '{col_name}': Value '{value}' cannot be cast to {expected_type.__name__}."
+            ))
+
+    batch_errors.sort(key=lambda error: error[:2])
+    return [message for _, _, message in batch_errors]
+
 
 def validate_csv(
     filepath: str,
     expected_columns: List[str],
-    column_types: Optional[Dict[str, type]] = None
+    column_types: Optional[Dict[str, type]] = None,
+    sample_rows: Optional[int] = None
 ) -> Tuple[bool, List[str]]:
     """
     Validates a CSV file against expected columns and data types.
@@ -17,6 +230,9 @@ def validate_csv(
         expected_columns: A list of column names expected in the header.
         column_types: A dictionary mapping column names to their expected types
                       (e.g., {'age': int, 'score': float}).
+        sample_rows: If set, only the first N data rows are validated. Useful as
+                     a quick schema sanity check on large files; None (the
+                     default) validates every row.
 
     Returns:
         A tuple containing:
@@ -27,12 +243,31 @@ def validate_csv(
     column_types = column_types or {}
 
     try:
-        with open(filepath, mode='r', encoding='utf-8', newline='') as csvfile:
-            reader = csv.reader(csvfile)
+        # mmap cannot map an empty file.
+        if os.path.getsize(filepath) == 0:
+            return False, ["CSV file is empty or contains only a header."]
+
+        with open(filepath, mode='rb') as csvfile, \
+                mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Quoted fields may contain commas or line breaks, and the csv module also
+            # ends a row at a bare '\r', so only files with neither are split on raw
+            # bytes; the rest go through the csv module.
+            use_reader = mm.find(b'"') != -1 or (
+                mm.find(b'\r') != -1 and _BARE_CR_RE.search(mm) is not None
+            )
+
+            if use_reader:
+                reader = csv.reader(io.TextIOWrapper(csvfile, encoding='utf-8', newline=''))
+                header = next(reader, None)
+                body_start = 0
+            else:
+                header_end = mm.find(b'\n')
+                if header_end == -1:
+                    header_end = len(mm)
+                header = next(csv.reader([mm[:header_end].decode('utf-8')]))
+                body_start = header_end + 1
 
-            try:
-                header = next(reader)
-            except StopIteration:
+            if header is None:
                 return False, ["CSV file is empty or contains only a header."]
 
             # 1. Validate header columns
@@ -44,29 +279,34 @@ def validate_csv(
                 return False, errors
 
             header_map = {name: i for i, name in enumerate(header)}
+            num_columns = len(header)
+
+            # Resolve column indices once rather than on every row.
+            typed_columns = [
+                (col_name, header_map[col_name], expected_type)
+                for col_name, expected_type in column_types.items()
+            ]
+            col_indices = sorted({col_index for _, col_index, _ in typed_columns})
+
+            if use_reader:
+                batches = _iter_reader_batches(reader, num_columns, col_indices)
+            else:
+                batches = _iter_mmap_batches(mm, body_start, num_columns, col_indices)
+
+            # 2. Validate data rows in batches, one typed column at a time.
+            row_num = 2
+            remaining = sample_rows
+            for counts, columns in batches:
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    counts = counts[:remaining]
+                    complete = counts.count(num_columns)
+                    columns = {i: values[:complete] for i, values in columns.items()}
+                    remaining -= len(counts)
 
-            # 2. Validate data rows
-            for row_num, row in enumerate(reader, start=2):
-                if len(row) != len(header):
-                    errors.append(f"Row {row_num}: Mismatched number of columns. Expected {len(header)}, found {len(row)}.")
-                    continue
-
-                for col_name, expected_type in column_types.items():
-                    col_index = header_map[col_name]
-                    value = row[col_index]
-
-                    if not value.strip() and expected_type is not str:
-                        # Allow empty values for non-string types, assuming they represent NULL.
-                        # Add specific logic here if empty strings should be an error.
-                        continue
-
-                    try:
-                        # Perform type casting to validate
-                        expected_type(value)
-                    except (ValueError, TypeError):
-                        errors.append(
-                            f"Row {row_num}, Column '{col_name}': Value '{value}' cannot be cast to {expected_type.__name__}."
-                        )
+                errors.extend(_validate_batch(counts, columns, row_num, num_columns, typed_columns))
+                row_num += len(counts)
 
     except FileNotFoundError:
         return False, [f"File not found at path: {filepath}"]
@@ -1,15 +1,31 @@
 import os
 import json
+import math
 import time
+import atexit
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import sqlite3
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
+import orjson
 import requests
-from web3 import Web3
+from eth_abi import decode as abi_decode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncWeb3, HTTPProvider, Web3, WebsocketProviderV2
 from web3.contract import Contract
-from web3.types import LogReceipt
+from web3.types import LogReceipt, RPCEndpoint, RPCResponse
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; the default asyncio event loop is used instead.
+    uvloop = None
+
 # --- Configuration & Setup ---
 
 load_dotenv()
@@ -67,75 +83,431 @@ BRIDGE_CONTRACT_ABI = json.loads('''
 ]
 ''')
 
-STATE_FILE = 'processed_events_state.json'
+STATE_DB_FILE = 'processed_events_state.sqlite3'
+# JSON state written by earlier versions; imported into the database on first start.
+LEGACY_STATE_FILE = 'processed_events_state.json'
+# Number of signatures known to be processed that are kept in memory to answer
+# repeated lookups without a query.
+RECENT_SIGNATURES_CACHE_SIZE = 4096
+# Sizing of the Bloom filter that answers most "is this event new?" checks without
+# touching the database.
+BLOOM_INITIAL_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 1e-4
+# Bytes of the state database that SQLite reads through a memory map rather than
+# copying pages into its own cache.
+STATE_DB_MMAP_SIZE = 256 << 20
+# Columns of the processed_events table. It is created WITHOUT ROWID, so rows are
+# stored in the signature B-tree itself instead of in a rowid table plus an index.
+PROCESSED_EVENTS_COLUMNS = "signature BLOB PRIMARY KEY, data TEXT NOT NULL, processed_at REAL NOT NULL"
+# Maximum number of events relayed at the same time; also the size of the
+# relayer's connection pool.
+MAX_CONCURRENT_RELAYS = 16
+# Maximum number of blocks requested in a single eth_getLogs call; many providers
+# reject larger ranges.
+GET_LOGS_BLOCK_RANGE = 2000
+# Connection pool of the session used for JSON-RPC calls to the source chain node:
+# the number of hosts kept, the connections kept open per host, the number of
+# retries on connection errors, and the timeout of each request in seconds.
+RPC_POOL_CONNECTIONS = 4
+RPC_POOL_MAXSIZE = 16
+RPC_MAX_RETRIES = 3
+RPC_REQUEST_TIMEOUT = 10
+# ABI entry of the TokensLocked event, whose logs are decoded by the EventProcessor.
+TOKENS_LOCKED_EVENT_ABI = next(item for item in BRIDGE_CONTRACT_ABI if item['name'] == 'TokensLocked')
+
+# Range of integers orjson can serialize. Wider ones, such as most uint256 token
+# amounts, have to go through the stdlib encoder.
+ORJSON_INT_MIN = -(1 << 63)
+ORJSON_INT_MAX = (1 << 64) - 1
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+def _has_wide_int(obj: Any) -> bool:
+    """
+    Returns True if obj is a dict holding, directly or in nested dicts, an integer
+    outside the range orjson accepts. Only dicts are walked, which covers the event
+    data and relay payloads this is called with.
+    """
+    if type(obj) is not dict:
+        return False
+    for value in obj.values():
+        if type(value) is int:
+            if not ORJSON_INT_MIN <= value <= ORJSON_INT_MAX:
+                return True
+        elif type(value) is dict and _has_wide_int(value):
+            return True
+    return False
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes obj to compact JSON, with orjson when every integer in it fits in 64
+    bits and with the stdlib encoder otherwise. The range is checked up front, since
+    letting orjson fail first costs more than the stdlib encoder alone.
+    """
+    if not _has_wide_int(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # A wide integer in a shape _has_wide_int does not walk, e.g. a list.
+            pass
+    return _COMPACT_JSON_ENCODER.encode(obj).encode('utf-8')
+
+class BloomFilter:
+    """
+    A scalable Bloom filter: membership checks may return false positives but never
+    false negatives. When a stage fills up, a new stage with twice the capacity and
+    half the error rate is added, so the overall error rate stays bounded as the
+    set grows.
+    """
+    def __init__(self, initial_capacity: int, error_rate: float):
+        """
+        Initializes an empty filter.
+
+        Args:
+            initial_capacity (int): The number of items the first stage is sized for.
+            error_rate (float): The target false-positive rate.
+        """
+        self._stages: List[Tuple[bytearray, int, int, int]] = []  # (bits, num_bits, num_hashes, capacity)
+        self._next_capacity = initial_capacity
+        self._next_error_rate = error_rate / 2  # the stage error rates sum to error_rate
+        self._count_in_last_stage = 0
+        self._add_stage()
+
+    def _add_stage(self):
+        """
+        Appends an empty stage sized for the next capacity and error rate, then
+        doubles the capacity and halves the error rate for the stage after it.
+        A stage for n items at error rate p has m = -n * ln(p) / ln(2)^2 bits and
+        k = m / n * ln(2) hash positions per item, the standard optimal sizing.
+        The stage error rates form the series error_rate/2 + error_rate/4 + ...,
+        which never exceeds error_rate however many stages are added.
+        """
+        capacity, error_rate = self._next_capacity, self._next_error_rate
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._stages.append((bytearray((num_bits + 7) // 8), num_bits, num_hashes, capacity))
+        self._next_capacity *= 2
+        self._next_error_rate /= 2
+        self._count_in_last_stage = 0
+
+    @staticmethod
+    def _hashes(item: bytes) -> Tuple[int, int]:
+        """
+        Returns the two base hashes of an item, taken from one 128-bit blake2b digest.
+
+        Bit positions are derived by double hashing: the i-th position in a stage is
+        (h1 + i * h2) % num_bits, which gives as many positions as the stage needs
+        from a single digest. h2 is forced odd so that the step is never zero and
+        the positions don't collapse onto h1.
+        """
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def add(self, item: bytes):
+        """
+        Adds an item to the filter.
+        """
+        bits, num_bits, num_hashes, capacity = self._stages[-1]
+        if self._count_in_last_stage >= capacity:
+            self._add_stage()
+            bits, num_bits, num_hashes, capacity = self._stages[-1]
+
+        h1, h2 = self._hashes(item)
+        for i in range(num_hashes):
+            position = (h1 + i * h2) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count_in_last_stage += 1
+
+    def __contains__(self, item: bytes) -> bool:
+        """
+        Returns True if the item may have been added to any stage.
+        """
+        h1, h2 = self._hashes(item)
+        for bits, num_bits, num_hashes, _ in self._stages:
+            for i in range(num_hashes):
+                position = (h1 + i * h2) % num_bits
+                if not bits[position >> 3] & (1 << (position & 7)):
+                    break
+            else:
+                return True
+        return False
 
 class StateDB:
     """
     Manages the state of processed events to prevent re-processing.
-    Persists state to a local JSON file.
+    Persists state to a SQLite database in WAL mode, keyed by event signature: the
+    32-byte transaction hash followed by the 4-byte big-endian log index.
+    Marked events are buffered in memory until flush() is called.
     """
-    def __init__(self, state_file_path: str):
+    def __init__(self, db_path: str, legacy_state_file_path: Optional[str] = None):
         """
         Initializes the StateDB.
 
         Args:
-            state_file_path (str): The path to the JSON file for state persistence.
+            db_path (str): The path to the SQLite database for state persistence.
+            legacy_state_file_path (Optional[str]): The path to a JSON state file (and its
+                '.log') from an earlier version. If present, its events are imported once
+                and the files are renamed with a '.migrated' suffix.
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={STATE_DB_MMAP_SIZE}")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS processed_events ({PROCESSED_EVENTS_COLUMNS}) WITHOUT ROWID")
+        self._pending: Dict[bytes, Tuple[str, float]] = {}
+        self._recent: OrderedDict[bytes, None] = OrderedDict()
+
+        self._migrate_rowid_table()
+        self._migrate_text_signatures()
+        if legacy_state_file_path:
+            self._import_legacy_state(legacy_state_file_path)
+
+        # Most events the listener sees are new, and the filter can prove that without a query.
+        self._bloom = BloomFilter(BLOOM_INITIAL_CAPACITY, BLOOM_ERROR_RATE)
+        count = 0
+        for (event_signature,) in self._conn.execute("SELECT signature FROM processed_events"):
+            self._bloom.add(event_signature)
+            count += 1
+        logger.info("StateDB initialized. Loaded %d processed events from %s.", count, self.db_path)
+
+    def _import_legacy_state(self, state_file_path: str):
         """
-        self.state_file_path = state_file_path
-        self.processed_events = self._load_state()
-        logger.info(f"StateDB initialized. Loaded {len(self.processed_events)} processed events from {self.state_file_path}.")
+        Imports a JSON snapshot and its append-only log written by an earlier version.
+        Does nothing if neither file exists.
+        """
+        log_file_path = f"{state_file_path}.log"
+        legacy_paths = [path for path in (state_file_path, log_file_path) if os.path.exists(path)]
+        if not legacy_paths:
+            return
+
+        events = _load_legacy_snapshot(state_file_path)
+        events.update(_replay_legacy_log(log_file_path))
+        rows = [
+            (_signature_from_legacy_key(key), _dumps(entry.get('data')).decode('utf-8'), entry.get('processed_at', time.time()))
+            for key, entry in events.items()
+        ]
+        try:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed_events (signature, data, processed_at) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.error("Failed to import legacy state from %s: %s", state_file_path, e)
+            return
+
+        for path in legacy_paths:
+            os.replace(path, f"{path}.migrated")
+        logger.info("Imported %d processed events from legacy state file %s.", len(rows), state_file_path)
 
-    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+    def _migrate_rowid_table(self):
         """
-        Loads the state from the JSON file.
-        Returns an empty dictionary if the file doesn't exist.
+        Rebuilds a processed_events table created by an earlier version, which kept
+        every signature twice (in the table and in its primary key index), as a
+        WITHOUT ROWID table, then vacuums the database to release the freed pages.
         """
+        (table_sql,) = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'processed_events'"
+        ).fetchone()
+        if 'WITHOUT ROWID' in table_sql.upper():
+            return
+
+        try:
+            self._conn.execute("BEGIN")
+            self._conn.execute(f"CREATE TABLE processed_events_compact ({PROCESSED_EVENTS_COLUMNS}) WITHOUT ROWID")
+            self._conn.execute("INSERT OR IGNORE INTO processed_events_compact SELECT signature, data, processed_at FROM processed_events")
+            self._conn.execute("DROP TABLE processed_events")
+            self._conn.execute("ALTER TABLE processed_events_compact RENAME TO processed_events")
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.error("Failed to compact the processed events table in %s: %s", self.db_path, e)
+            return
+        self._conn.execute("VACUUM")
+        logger.info("Compacted the processed events table in %s.", self.db_path)
+
+    def _migrate_text_signatures(self):
+        """
+        Converts signatures stored as '<tx hash hex>-<log index>' text by earlier versions
+        to their bytes form.
+        """
+        keys = [key for (key,) in self._conn.execute(
+            "SELECT signature FROM processed_events WHERE typeof(signature) = 'text'"
+        )]
+        if not keys:
+            return
+
         try:
-            with open(self.state_file_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.warning(f"State file not found at {self.state_file_path}. Starting with an empty state.")
-            return {}
-        except json.JSONDecodeError:
-            logger.error(f"Error decoding JSON from {self.state_file_path}. Starting with an empty state.")
-            return {}
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE OR IGNORE processed_events SET signature = ? WHERE signature = ?",
+                [(_signature_from_legacy_key(key), key) for key in keys]
+            )
+            # Rows left over already exist in bytes form.
+            self._conn.execute("DELETE FROM processed_events WHERE typeof(signature) = 'text'")
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.error("Failed to convert stored event signatures in %s: %s", self.db_path, e)
+            return
+        logger.info("Converted %d stored event signatures to bytes.", len(keys))
 
-    def _save_state(self):
+    def _remember(self, event_signature: bytes):
+        """
+        Records a processed signature in the in-memory cache of recent signatures.
         """
-        Saves the current state to the JSON file.
+        self._recent[event_signature] = None
+        self._recent.move_to_end(event_signature)
+        if len(self._recent) > RECENT_SIGNATURES_CACHE_SIZE:
+            self._recent.popitem(last=False)
+
+    def flush(self):
         """
+        Writes all events marked since the last flush to the database in a single
+        transaction. Does nothing if no events are pending.
+        """
+        if not self._pending:
+            return
+
+        rows = [(signature, data, processed_at) for signature, (data, processed_at) in self._pending.items()]
         try:
-            with open(self.state_file_path, 'w') as f:
-                json.dump(self.processed_events, f, indent=4)
-        except IOError as e:
-            logger.error(f"Failed to save state to {self.state_file_path}: {e}")
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed_events (signature, data, processed_at) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.error("Failed to write %d event(s) to %s: %s", len(rows), self.db_path, e)
+            return
 
-    def is_event_processed(self, event_signature: str) -> bool:
+        logger.debug("Flushed %d processed event(s) to %s.", len(rows), self.db_path)
+        for event_signature in self._pending:
+            self._remember(event_signature)
+        self._pending.clear()
+
+    def is_event_processed(self, event_signature: bytes) -> bool:
         """
         Checks if an event has already been processed.
 
         Args:
-            event_signature (str): A unique identifier for the event (e.g., transaction hash + log index).
+            event_signature (bytes): A unique identifier for the event (transaction hash + log index).
 
         Returns:
             bool: True if the event has been processed, False otherwise.
         """
-        return event_signature in self.processed_events
+        if event_signature not in self._bloom:
+            return False
+        if event_signature in self._pending or event_signature in self._recent:
+            return True
+
+        row = self._conn.execute(
+            "SELECT 1 FROM processed_events WHERE signature = ? LIMIT 1", (event_signature,)
+        ).fetchone()
+        if row is None:
+            return False
+        self._remember(event_signature)
+        return True
 
-    def mark_event_as_processed(self, event_signature: str, event_data: Dict[str, Any]):
+    def mark_event_as_processed(self, event_signature: bytes, event_data: Dict[str, Any]):
         """
-        Marks an event as processed and saves the state.
+        Marks an event as processed. It is written to the database on the next flush().
 
         Args:
-            event_signature (str): The unique identifier for the event.
+            event_signature (bytes): The unique identifier for the event.
             event_data (Dict[str, Any]): The data associated with the event.
         """
-        self.processed_events[event_signature] = {
-            'data': event_data,
-            'processed_at': time.time()
-        }
-        self._save_state()
-        logger.info(f"Event {event_signature} marked as processed.")
+        self._pending[event_signature] = (_dumps(event_data).decode('utf-8'), time.time())
+        self._bloom.add(event_signature)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Event %s marked as processed.", event_signature.hex())
+
+    def close(self):
+        """
+        Flushes any pending events and closes the database connection.
+        """
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+
+def _signature_from_legacy_key(key: str) -> bytes:
+    """
+    Converts a '<tx hash hex>-<log index>' signature used by earlier versions to its bytes form.
+    """
+    tx_hash, log_index = key.rsplit('-', 1)
+    return bytes.fromhex(tx_hash.removeprefix('0x')) + int(log_index).to_bytes(4, 'big')
+
+
+def _load_legacy_snapshot(state_file_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads a legacy JSON state snapshot.
+    Returns an empty dictionary if the file doesn't exist or can't be decoded.
+    """
+    try:
+        with open(state_file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        logger.error("Error decoding JSON from %s. Skipping it.", state_file_path)
+        return {}
+
+
+def _replay_legacy_log(log_file_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads the events recorded in a legacy append-only state log.
+    Returns an empty dictionary if the log doesn't exist.
+    """
+    events = {}
+    try:
+        with open(log_file_path, 'rb') as f:
+            for line_num, line in enumerate(f, start=1):
+                try:
+                    events.update(json.loads(line))
+                except json.JSONDecodeError:
+                    # Typically the last line, cut short by a crash mid-write.
+                    logger.warning("Skipping unreadable line %d in %s.", line_num, log_file_path)
+    except FileNotFoundError:
+        pass
+    return events
+
+class SessionHTTPProvider(HTTPProvider):
+    """
+    An HTTPProvider that sends every request through one given requests.Session.
+    The stock provider looks its session up per thread, so calls made from worker
+    threads (asyncio.to_thread) would each get a default session without the
+    pool size and retries configured here.
+    """
+    def __init__(self, endpoint_uri: str, session: requests.Session, request_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Initializes the provider.
+
+        Args:
+            endpoint_uri (str): The HTTP URL of the blockchain node.
+            session (requests.Session): The session used for all requests.
+            request_kwargs (Optional[Dict[str, Any]]): Extra arguments for each POST, e.g. a timeout.
+        """
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self._session = session
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """
+        Sends a JSON-RPC request and returns the decoded response.
+        """
+        request_data = self.encode_rpc_request(method, params)
+        response = self._session.post(self.endpoint_uri, data=request_data, **self.get_request_kwargs())
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
 
 class BlockchainConnector:
     """
@@ -150,6 +522,16 @@ class BlockchainConnector:
         """
         self.rpc_url = rpc_url
         self.web3: Optional[Web3] = None
+        # Keeps the connections to the node alive across RPC calls instead of
+        # reconnecting (and renegotiating TLS) for each one.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=RPC_POOL_CONNECTIONS,
+            pool_maxsize=RPC_POOL_MAXSIZE,
+            max_retries=Retry(total=RPC_MAX_RETRIES, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
     def connect(self) -> bool:
         """
@@ -159,15 +541,19 @@ class BlockchainConnector:
             bool: True if connection is successful, False otherwise.
         """
         try:
-            self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            self.web3 = Web3(SessionHTTPProvider(
+                self.rpc_url,
+                self._session,
+                request_kwargs={'timeout': RPC_REQUEST_TIMEOUT}
+            ))
             if self.web3.is_connected():
-                logger.info(f"Successfully connected to blockchain node at {self.rpc_url}")
+                logger.info("Successfully connected to blockchain node at %s", self.rpc_url)
                 return True
             else:
-                logger.error(f"Failed to connect to blockchain node at {self.rpc_url}")
+                logger.error("Failed to connect to blockchain node at %s", self.rpc_url)
                 return False
         except Exception as e:
-            logger.error(f"Exception while connecting to {self.rpc_url}: {e}")
+            logger.error("Exception while connecting to %s: %s", self.rpc_url, e)
             return False
 
     def get_contract(self, address: str, abi: Dict) -> Optional[Contract]:
@@ -200,9 +586,15 @@ class BlockchainConnector:
         try:
             return self.web3.eth.block_number
         except Exception as e:
-            logger.error(f"Error getting latest block number: {e}")
+            logger.error("Error getting latest block number: %s", e)
             return None
 
+    def close(self):
+        """
+        Closes the pooled connections to the blockchain node.
+        """
+        self._session.close()
+
 class RelayerService:
     """
     Simulates relaying a transaction to a destination chain by calling an API endpoint.
@@ -215,6 +607,14 @@ class RelayerService:
             api_endpoint (str): The API endpoint to which the event data will be POSTed.
         """
         self.api_endpoint = api_endpoint
+        # One session for all relays keeps connections to the endpoint alive, so only
+        # the first request pays for the TCP and TLS handshake.
+        self._session = requests.Session()
+        self._session.headers.update({'Content-Type': 'application/json'})
+        adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_RELAYS)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RELAYS, thread_name_prefix='relayer')
 
     def relay_transaction(self, event_data: Dict[str, Any]) -> bool:
         """
@@ -226,59 +626,127 @@ class RelayerService:
         Returns:
             bool: True if the API call was successful (2xx status), False otherwise.
         """
-        headers = {'Content-Type': 'application/json'}
         payload = {
             'eventType': 'TokensLocked',
             'payload': event_data
         }
-        logger.info(f"Relaying transaction to {self.api_endpoint} with payload: {payload}")
+        # Rendering the payload dict is costly, so skip it when INFO is disabled.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Relaying transaction to %s with payload: %s", self.api_endpoint, payload)
         try:
-            response = requests.post(self.api_endpoint, json=payload, headers=headers, timeout=10)
+            # The session already sends the JSON Content-Type header.
+            response = self._session.post(self.api_endpoint, data=_dumps(payload), timeout=10)
             response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
-            logger.info(f"Successfully relayed transaction. API response: {response.json()}")
+            api_response = response.json()
+            logger.info("Successfully relayed transaction. API response: %s", api_response)
             return True
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to relay transaction via API: {e}")
+            logger.error("Failed to relay transaction via API: %s", e)
             return False
 
+    async def relay_transaction_async(self, event_data: Dict[str, Any]) -> bool:
+        """
+        Runs relay_transaction on the relayer's thread pool so that several relays
+        can be in flight at once while sharing the session's connection pool.
+
+        Args:
+            event_data (Dict[str, Any]): The processed event data to be relayed.
+
+        Returns:
+            bool: True if the API call was successful (2xx status), False otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.relay_transaction, event_data)
+
+    def close(self):
+        """
+        Stops the relay threads and closes the pooled connections to the API endpoint.
+        """
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
 class EventProcessor:
     """
     Processes events fetched by the EventListener.
     """
-    def __init__(self, state_db: StateDB, relayer: RelayerService):
+    def __init__(self, state_db: StateDB, relayer: RelayerService, max_concurrent_relays: int = MAX_CONCURRENT_RELAYS):
         """
         Initializes the processor.
 
         Args:
             state_db (StateDB): The state management instance.
             relayer (RelayerService): The service for relaying actions to the destination.
+            max_concurrent_relays (int): The maximum number of events relayed at the same time.
         """
         self.state_db = state_db
         self.relayer = relayer
+        self.max_concurrent_relays = max_concurrent_relays
+        # Resolved once so that decoding a log is a single eth_abi call plus topic slicing.
+        inputs = TOKENS_LOCKED_EVENT_ABI['inputs']
+        self._indexed_names = [i['name'] for i in inputs if i['indexed']]
+        self._data_names = [i['name'] for i in inputs if not i['indexed']]
+        self._data_types = [i['type'] for i in inputs if not i['indexed']]
+
+    def _decode_args(self, event: LogReceipt) -> Dict[str, Any]:
+        """
+        Decodes the arguments of a raw TokensLocked log.
+
+        The non-indexed arguments are decoded from the log data with a single eth_abi
+        call. The indexed arguments are all addresses, which are the last 20 bytes
+        of their topic.
+
+        Args:
+            event (LogReceipt): The raw event log returned by eth_getLogs.
+
+        Returns:
+            Dict[str, Any]: The event arguments, keyed by their ABI name.
+        """
+        args = dict(zip(self._data_names, abi_decode(self._data_types, event['data'])))
+        for name, topic in zip(self._indexed_names, event['topics'][1:]):
+            args[name] = Web3.to_checksum_address(topic[-20:])
+        return args
 
-    def process_event(self, event: LogReceipt):
+    async def process_events(self, events: List[LogReceipt]):
+        """
+        Processes a batch of event logs concurrently, so that the relay round-trips
+        overlap instead of adding up.
+
+        Args:
+            events (List[LogReceipt]): The raw event logs returned by eth_getLogs.
+        """
+        relay_slots = asyncio.Semaphore(self.max_concurrent_relays)
+
+        async def process(event: LogReceipt):
+            async with relay_slots:
+                await self.process_event(event)
+
+        await asyncio.gather(*(process(event) for event in events))
+
+    async def process_event(self, event: LogReceipt):
         """
         Processes a single blockchain event log.
-        It checks for duplicates, formats the data, and triggers the relayer.
+        It checks for duplicates, decodes and formats the data, and triggers the relayer.
+        Duplicates are skipped before their arguments are decoded.
 
         Args:
-            event (LogReceipt): The raw event log from Web3.py.
+            event (LogReceipt): The raw event log returned by eth_getLogs.
         """
-        # Create a unique signature for the event to prevent re-processing
-        tx_hash = event['transactionHash'].hex()
-        log_index = event['logIndex']
-        event_signature = f"{tx_hash}-{log_index}"
+        # Create a unique signature for the event to prevent re-processing: the raw
+        # transaction hash followed by the log index, with no hex encoding.
+        event_signature = event['transactionHash'] + event['logIndex'].to_bytes(4, 'big')
 
         if self.state_db.is_event_processed(event_signature):
-            logger.debug(f"Skipping already processed event: {event_signature}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping already processed event: %s", event_signature.hex())
             return
 
-        logger.info(f"Processing new TokensLocked event: {event_signature}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processing new TokensLocked event: %s", event_signature.hex())
 
         # Format event data for relaying
-        event_args = event['args']
+        event_args = self._decode_args(event)
         processed_data = {
-            'source_transaction_hash': tx_hash,
+            'source_transaction_hash': event['transactionHash'].hex(),
             'sender': event_args['sender'],
             'recipient': event_args['recipient'],
             'amount': event_args['amount'],
@@ -286,69 +754,134 @@ class EventProcessor:
         }
 
         # Attempt to relay the transaction
-        if self.relayer.relay_transaction(processed_data):
+        if await self.relayer.relay_transaction_async(processed_data):
             # If relaying is successful, mark the event as processed
             self.state_db.mark_event_as_processed(event_signature, processed_data)
         else:
-            logger.warning(f"Relaying failed for event {event_signature}. It will be retried in the next poll.")
+            logger.warning("Relaying failed for event %s. It will be retried in the next poll.", event_signature.hex())
 
 class EventListener:
     """
     The core component that listens for new blocks and filters for specific events.
     """
-    def __init__(self, connector: BlockchainConnector, contract: Contract, processor: EventProcessor, start_block: int):
+    def __init__(
+        self,
+        connector: BlockchainConnector,
+        contract: Contract,
+        processor: EventProcessor,
+        start_block: int,
+        ws_url: Optional[str] = None
+    ):
         self.connector = connector
         self.contract = contract
         self.processor = processor
         self.current_block = start_block
+        # Optional WebSocket endpoint of the same node, used to be notified of new blocks.
+        self.ws_url = ws_url
         self.poll_interval = 15  # seconds
         self.reorg_confirmation_depth = 5 # blocks
+        # The parts of the eth_getLogs filter that never change: the contract address and
+        # the keccak256 of the TokensLocked signature as the topic, resolved once.
+        self._log_filter = {
+            'address': self.contract.address,
+            'topics': [self.contract.events.TokensLocked.build_filter().topics[0]]
+        }
+
+    def _fetch_events(self, from_block: int, to_block: int) -> List[LogReceipt]:
+        """
+        Fetches the raw TokensLocked logs emitted in a block range with a single
+        eth_getLogs call, filtered by contract address and event topic. Decoding is
+        left to the EventProcessor, which only does it for events not yet processed.
+        """
+        return self.connector.web3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            **self._log_filter
+        })
 
-    def start(self):
+    async def _scan_up_to(self, latest_block: int):
+        """
+        Scans the blocks that are confirmed as of latest_block and not yet scanned.
+
+        Args:
+            latest_block (int): The number of the current head of the chain.
+        """
+        # To handle reorgs, we only process blocks that are a few blocks old.
+        target_block = latest_block - self.reorg_confirmation_depth
+
+        if self.current_block > target_block:
+            logger.info("Waiting for more blocks to be confirmed. Current: %d, Target: %d", self.current_block, target_block)
+            return
+
+        logger.info("Scanning for events from block %d to %d", self.current_block, target_block)
+
+        # Scan in windows the RPC provider will accept, recording progress after each
+        # one so that a failure only repeats the window it happened in.
+        for chunk_start in range(self.current_block, target_block + 1, GET_LOGS_BLOCK_RANGE):
+            chunk_end = min(chunk_start + GET_LOGS_BLOCK_RANGE - 1, target_block)
+            events = await asyncio.to_thread(self._fetch_events, chunk_start, chunk_end)
+
+            if events:
+                logger.info("Found %d new TokensLocked event(s) in blocks %d to %d.", len(events), chunk_start, chunk_end)
+                await self.processor.process_events(events)
+                # Persist everything marked in this window with a single write.
+                self.processor.state_db.flush()
+            else:
+                logger.info("No new events found in blocks %d to %d.", chunk_start, chunk_end)
+
+            # Update the current block to continue from where we left off
+            self.current_block = chunk_end + 1
+
+    async def _poll(self):
+        """
+        Fetches the latest block number, scans up to it and waits for the poll interval.
+        """
+        try:
+            latest_block = await asyncio.to_thread(self.connector.get_latest_block_number)
+            if latest_block is None:
+                logger.warning("Could not fetch latest block number. Retrying...")
+            else:
+                await self._scan_up_to(latest_block)
+        except Exception as e:
+            logger.error("An error occurred in the listening loop: %s", e)
+            # In case of a major error, wait longer before retrying
+            await asyncio.sleep(self.poll_interval * 2)
+
+        await asyncio.sleep(self.poll_interval)
+
+    async def _follow_new_heads(self):
+        """
+        Subscribes to new block headers over the WebSocket endpoint and scans as soon
+        as each block arrives, instead of waiting for the next poll. Returns when the
+        node closes the connection.
+
+        Blocks rather than logs are subscribed to, so that events are still only
+        processed once they are reorg_confirmation_depth blocks deep; the scan itself
+        is the same eth_getLogs query used when polling.
+        """
+        async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.ws_url)) as w3:
+            await w3.eth.subscribe('newHeads')
+            logger.info("Subscribed to new blocks at %s", self.ws_url)
+            async for message in w3.ws.listen_to_websocket():
+                await self._scan_up_to(message['result']['number'])
+
+    async def start(self):
         """
         Starts the main event listening loop.
+        With a WebSocket URL, scans are triggered by new blocks pushed by the node; while
+        the subscription is unavailable, and without a WebSocket URL, the chain is polled.
+        Blocking Web3 calls run in worker threads so they don't stall the event loop.
         """
-        logger.info(f"Starting event listener for contract {self.contract.address} from block {self.current_block}")
+        logger.info("Starting event listener for contract %s from block %d", self.contract.address, self.current_block)
         while True:
-            try:
-                latest_block = self.connector.get_latest_block_number()
-                if latest_block is None:
-                    logger.warning("Could not fetch latest block number. Retrying...")
-                    time.sleep(self.poll_interval)
-                    continue
-                
-                # To handle reorgs, we only process blocks that are a few blocks old.
-                target_block = latest_block - self.reorg_confirmation_depth
-
-                if self.current_block > target_block:
-                    logger.info(f"Waiting for more blocks to be confirmed. Current: {self.current_block}, Target: {target_block}")
-                    time.sleep(self.poll_interval)
-                    continue
-
-                logger.info(f"Scanning for events from block {self.current_block} to {target_block}")
-
-                event_filter = self.contract.events.TokensLocked.create_filter(
-                    fromBlock=self.current_block,
-                    toBlock=target_block
-                )
-                events = event_filter.get_all_entries()
-
-                if events:
-                    logger.info(f"Found {len(events)} new TokensLocked event(s).")
-                    for event in events:
-                        self.processor.process_event(event)
-                else:
-                    logger.info("No new events found in this range.")
-
-                # Update the current block to continue from where we left off
-                self.current_block = target_block + 1
-
-            except Exception as e:
-                logger.error(f"An error occurred in the listening loop: {e}")
-                # In case of a major error, wait longer before retrying
-                time.sleep(self.poll_interval * 2)
-
-            time.sleep(self.poll_interval)
+            if self.ws_url:
+                try:
+                    await self._follow_new_heads()
+                    logger.warning("Block subscription at %s was closed. Polling until it is re-established.", self.ws_url)
+                except Exception as e:
+                    logger.warning("Block subscription at %s failed: %s. Polling until it is re-established.", self.ws_url, e)
+
+            await self._poll()
 
 def main():
     """
@@ -358,6 +891,7 @@ def main():
     source_rpc_url = os.getenv("SOURCE_RPC_URL")
     bridge_contract_address = os.getenv("BRIDGE_CONTRACT_ADDRESS")
     relayer_api_endpoint = os.getenv("RELAYER_API_ENDPOINT")
+    source_ws_url = os.getenv("SOURCE_WS_URL")
     start_block_str = os.getenv("START_BLOCK", "latest")
 
     if not all([source_rpc_url, bridge_contract_address, relayer_api_endpoint]):
@@ -368,7 +902,8 @@ def main():
     logger.info("--- Initializing Cross-Chain Bridge Listener ---")
     
     # 1. State Database
-    state_db = StateDB(STATE_FILE)
+    state_db = StateDB(STATE_DB_FILE, legacy_state_file_path=LEGACY_STATE_FILE)
+    atexit.register(state_db.close)
 
     # 2. Blockchain Connector
     connector = BlockchainConnector(source_rpc_url)
@@ -396,23 +931,30 @@ def main():
         try:
             start_block = int(start_block_str)
         except ValueError:
-            logger.critical(f"Invalid START_BLOCK value: {start_block_str}. Must be an integer or 'latest'.")
+            logger.critical("Invalid START_BLOCK value: %s. Must be an integer or 'latest'.", start_block_str)
             return
 
     listener = EventListener(
         connector=connector,
         contract=contract,
         processor=processor,
-        start_block=start_block
+        start_block=start_block,
+        ws_url=source_ws_url
     )
 
     # --- Start the service ---
     try:
-        listener.start()
+        # uvloop's libuv-based event loop handles the socket I/O faster than the default one.
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(listener.start())
     except KeyboardInterrupt:
         logger.info("Shutdown signal received. Exiting gracefully.")
     except Exception as e:
-        logger.critical(f"An unhandled exception occurred: {e}", exc_info=True)
+        logger.critical("An unhandled exception occurred: %s", e, exc_info=True)
+    finally:
+        relayer.close()
+        connector.close()
+        state_db.close()
 
 if __name__ == '__main__':
     main()